@@ -1,7 +1,10 @@
-import pandas as pd  # Для работы с Excel-файлами
 import numpy as np  # Для числовых расчетов и работы с массивами
+import matplotlib as mpl  # Настройки отрисовки
 import matplotlib.pyplot as plt  # Графики
-from matplotlib.widgets import Button
+from matplotlib.widgets import Button, Slider
+from matplotlib.collections import LineCollection  # Набор отрезков одним объектом
+from io_utils import load_input  # Чтение исходных данных из Excel-файла
+from plot_utils import build_curve_segments  # Вершины кривых для LineCollection
 
 class Beam:
     def __init__(self, section_names, X, A, loads, LC_names):
@@ -18,6 +21,9 @@ class Beam:
         self.A = A  # Сохраняем площади сечений
         self.loads = loads  # Сохраняем нагрузки (форма: [нагрузки, расчетные_случаи, сечения])
         self.LC_names = LC_names  # Сохраняем названия расчетных случаев
+        self._fig = None  # Окно графика, переиспользуемое при повторных вызовах plot_stresses
+        self._cids = []  # Идентификаторы обработчиков событий текущего окна
+        self._scroll = None  # Ползунок прокрутки легенды (если он создан)
 
     def calculate_stresses(self):
         """
@@ -26,14 +32,14 @@ class Beam:
         """
         return (self.loads / self.A) / 1e6  # МПа (по условию задачи)
 
-    def calculate_ms(self, sigma_cr, stresses):
+    def calculate_ms(self, sigma_cr):
         """
-        Рассчитывает коэффициенты запаса прочности
+        Рассчитывает коэффициенты запаса прочности напрямую по нагрузкам, без промежуточного массива напряжений
+        (sigma_cr / (loads / A / 1e6) = sigma_cr * A * 1e6 / loads)
         :param sigma_cr: критическое напряжение
-        :param stresses: массив напряжений (результат calculate_stresses)
         :return: 2D-массив коэффициентов запаса
         """
-        return sigma_cr / stresses  # Безразмерная величина
+        return np.divide(sigma_cr * self.A * 1e6, self.loads)  # Безразмерная величина, один проход по 2D-массиву нагрузок
 
     def find_min_ms(self, ms):
         """
@@ -41,64 +47,99 @@ class Beam:
         :param ms: массив коэффициентов запаса (2D: [расчетные_случаи, сечения])
         :return: список кортежей (мин_значение, название_сечения, название_расчетного_случая)
         """
-        min_value = np.min(ms)  # Находим глобальный минимум
-        indices = np.argwhere(ms == min_value)  # Получаем все пары индексов (расчетный_случай, сечение)
-
-        results = []
-        for (lc_idx, sec_idx) in indices:
-            results.append(
-                (min_value,
-                 self.section_names[sec_idx],
-                 self.LC_names[lc_idx])
-            )
+        min_value = ms.flat[ms.argmin()]  # Глобальный минимум - значение элемента массива
+        lc_indices, sec_indices = np.nonzero(ms == min_value)  # Индексы (расчетный_случай, сечение) всех минимумов
+
+        return [
+            (min_value, self.section_names[sec_idx], self.LC_names[lc_idx])
+            for lc_idx, sec_idx in zip(lc_indices, sec_indices)
+        ]
+
+    def _build_layout(self):
+        """
+        Создает окно графика и его области
+        :return: фигура, основная область графика, область легенды, область текста с минимальным КЗ
+        """
+        fig = plt.figure(figsize=(16, 8))  # Устанавливаем размер окна графика
+        ax = fig.add_axes([0.1, 0.1, 0.6, 0.8])  # Основная область графика [left, bottom, width, height]
+        ax_legend = fig.add_axes([0.75, 0.4, 0.2, 0.5])  # Область для легенды справа
+        ax_text = fig.add_axes([0.75, 0.1, 0.2, 0.2])  # Область для текста с минимальным КЗ
+        return fig, ax, ax_legend, ax_text
 
-        return results
+    def _reset_layout(self):
+        """
+        Очищает уже созданное окно графика для повторного построения без создания новой фигуры
+        """
+        for cid in self._cids:
+            self._fig.canvas.mpl_disconnect(cid)  # Отключаем обработчики предыдущего построения
+        if self._scroll is not None:
+            self._scroll.disconnect_events()
+            self._scroll.ax.remove()
+        for a in (self._ax, self._ax_legend, self._ax_text):
+            a.cla()
 
-    def plot_stresses(self, stresses, sigma_cr):
+    def plot_stresses(self, stresses, sigma_cr, ms=None):
         """
         Строит эпюры напряжений с интерактивной легендой.
         При клике на метку в легенде соответствующая кривая и вертикальные линии скрываются или становятся видимыми.
         При наведении курсора на область легенды появляется подсказка.
+        :param stresses: массив напряжений (результат calculate_stresses)
+        :param sigma_cr: критическое напряжение
+        :param ms: массив коэффициентов запаса (результат calculate_ms); если не задан, рассчитывается по нагрузкам
         """
-        # Создаем основное окно графика
-        fig = plt.figure(figsize=(16, 8))  # Устанавливаем размер окна графика
-
-        # Основная область графика
-        ax = fig.add_axes([0.1, 0.1, 0.6, 0.8])  # [left, bottom, width, height]
+        # Создаем основное окно графика или очищаем уже открытое
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, self._ax, self._ax_legend, self._ax_text = self._build_layout()
+        else:
+            self._reset_layout()
+        self._cids = []
+        self._scroll = None
+        fig, ax, ax_legend, ax_text = self._fig, self._ax, self._ax_legend, self._ax_text
         # `ax` — это основная область для отображения графиков.
 
-        # Хранение линий графиков и вертикальных линий
-        lines = []  # Список для хранения основных линий графиков
-        vertical_lines = []  # Список списков вертикальных линий для каждой кривой
-
-        # Основные графики напряжений
-        for i in range(stresses.shape[0]):  # Проходим по всем расчетным случаям
-            line, = ax.step(
-                self.X,  # Координаты X
-                stresses[i],  # Значения напряжений для текущего расчетного случая
-                where='post',  # Стиль линии ("ступеньки")
-                label=self.LC_names[i]  # Метка для легенды
+        # Хранение вертикальных линий
+        vertical_lines = []  # Коллекции вертикальных линий (по одной на каждую кривую)
+
+        # Вертикальные линии с шагом 0.2 (координаты и индексы общие для всех расчетных случаев)
+        x_min = np.min(self.X)  # Минимальное значение X
+        x_max = np.max(self.X)  # Максимальное значение X
+        x_ticks = np.arange(x_min, x_max, 0.2)  # Шаг 0.2
+        idx = np.searchsorted(self.X, x_ticks, side='right') - 1  # Индексы ближайших значений X
+        idx = np.clip(idx, 0, len(self.X) - 1)  # Защита от выхода за границы массива
+        heights = stresses[:, idx]  # Высоты вертикальных линий для всех расчетных случаев: [расчетные_случаи, шаги]
+
+        # Отрезки вертикальных линий от 0 до значения напряжения для всех расчетных случаев сразу:
+        # [расчетные_случаи, шаги, 2 точки, (x, y)]
+        tick_segments = np.zeros(heights.shape + (2, 2))
+        tick_segments[..., 0] = x_ticks[None, :, None]  # Координата X обеих точек отрезка
+        tick_segments[:, :, 1, 1] = heights  # Верхняя точка отрезка лежит на кривой
+
+        # Основные графики напряжений: все кривые-ступеньки одной коллекцией
+        n_lc = stresses.shape[0]  # Количество расчетных случаев
+        line_colors = plt.cm.tab10(np.arange(n_lc) % 10)  # RGBA-цвета всех кривых
+        curve_colors = line_colors.copy()  # Цвета кривых в коллекции (альфа-канал управляет видимостью)
+        # Упрощение путей кривых: Path читает эти настройки при создании, поэтому они действуют
+        # только на создаваемые здесь коллекции и не меняют глобальные rcParams
+        with mpl.rc_context({'path.simplify': True, 'path.simplify_threshold': 1.0}):
+            curves = LineCollection(
+                build_curve_segments(self.X, stresses, where='post'),  # Стиль линии ("ступеньки")
+                colors=curve_colors,
+                rasterized=True  # Растровая отрисовка кривых при сохранении в векторные форматы
             )
-            lines.append(line)  # Добавляем линию в список
-
-            # Добавляем вертикальные линии с шагом 0.2
-            x_min = np.min(self.X)  # Минимальное значение X
-            x_max = np.max(self.X)  # Максимальное значение X
-            x_ticks = np.arange(x_min, x_max, 0.2)  # Шаг 0.2
-            v_lines = []  # Храним вертикальные линии для текущей кривой
-            for x in x_ticks:
-                idx = np.searchsorted(self.X, x, side='right') - 1  # Находим индекс ближайшего значения X
-                idx = np.clip(idx, 0, len(self.X) - 1)  # Защита от выхода за границы массива
-                stress_val = stresses[i, idx]  # Значение напряжения на кривой
-                v_line, = ax.plot(
-                    [x, x], [0, stress_val],  # Вертикальная линия от 0 до значения напряжения
-                    color=line.get_color(),  # Цвет совпадает с цветом кривой
-                    linestyle='--',          # Пунктирная линия
-                    linewidth=0.5,           # Толщина линии
-                    alpha=0.7                # Прозрачность
+            ax.add_collection(curves)
+
+            for i in range(n_lc):  # Проходим по всем расчетным случаям
+                v_lines = LineCollection(
+                    tick_segments[i],  # Отрезки вертикальных линий текущего расчетного случая
+                    colors=line_colors[i],    # Цвет совпадает с цветом кривой
+                    linestyles='--',          # Пунктирная линия
+                    linewidths=0.5,           # Толщина линии
+                    alpha=0.7,                # Прозрачность
+                    rasterized=True           # Растровая отрисовка при сохранении в векторные форматы
                 )
-                v_lines.append(v_line)  # Добавляем вертикальную линию в список
-            vertical_lines.append(v_lines)  # Добавляем список вертикальных линий для текущей кривой
+                ax.add_collection(v_lines)  # Одна коллекция вместо отдельной линии на каждый шаг
+                vertical_lines.append(v_lines)  # Добавляем коллекцию вертикальных линий для текущей кривой
+        ax.autoscale_view()  # Коллекции не пересчитывают масштаб осей автоматически
 
         # Критическое напряжение
         ax.axhline(
@@ -115,84 +156,187 @@ class Beam:
         ax.grid(True)  # Включаем сетку
 
         # Область для легенды справа
-        ax_legend = fig.add_axes([0.75, 0.4, 0.2, 0.5])  # [left, bottom, width, height]
         ax_legend.axis('off')  # Отключаем оси в области легенды
 
         # Легенда
-        legend_items = []  # Список для хранения элементов легенды
-        visibility = [True] * len(lines)  # Все линии изначально видимы
-        last_index = len(lines)  # Количество расчетных случаев
-        for i, line in enumerate(lines):  # Проходим по всем линиям
-            color = line.get_color()  # Получаем цвет линии
-            # Короткая цветная линия
-            line_patch = ax_legend.plot(
-                [0.1, 0.2], [1 - (i + 1) / (last_index + 1), 1 - (i + 1) / (last_index + 1)],  # Позиция линии
-                color=color,  # Цвет линии
-                linewidth=2,  # Толщина линии
-                transform=ax_legend.transAxes  # Используем относительные координаты
-            )[0]
+        visibility = [True] * n_lc  # Все линии изначально видимы
+        last_index = n_lc  # Количество расчетных случаев
+        # При большом числе расчетных случаев легенда показывает только окно из legend_window строк с прокруткой:
+        # объекты строк создаются один раз, при прокрутке меняются только их тексты и цвета
+        max_legend_items = 50  # Максимальное число строк легенды без прокрутки
+        legend_window = 25  # Число строк легенды в режиме прокрутки
+        n_rows = legend_window if last_index > max_legend_items else last_index  # Число строк легенды на экране
+        offset = 0  # Индекс расчетного случая в первой строке легенды
+        ys = 1 - np.arange(1, n_rows + 1) / (n_rows + 1)  # Вертикальные позиции элементов легенды
+
+        # Короткие цветные линии всех элементов легенды одной коллекцией
+        swatch_colors = line_colors[:n_rows].copy()  # RGBA-цвета строк легенды (альфа меняется по клику)
+        swatch_segments = np.stack([
+            np.column_stack([np.full(n_rows, 0.1), ys]),
+            np.column_stack([np.full(n_rows, 0.2), ys])
+        ], axis=1)  # [строки, 2 точки, (x, y)]
+        legend_swatches = LineCollection(
+            swatch_segments,
+            colors=swatch_colors,  # Цвета совпадают с цветами кривых
+            linewidths=2,  # Толщина линии
+            transform=ax_legend.transAxes  # Используем относительные координаты
+        )
+        ax_legend.add_collection(legend_swatches)
+
+        # Тексты меток остаются отдельными объектами: по ним определяется клик
+        legend_texts = []  # Список для хранения текстов легенды
+        for k in range(n_rows):  # Проходим по всем строкам легенды
             # Текст черного цвета
             text = ax_legend.text(
-                0.25, 1 - (i + 1) / (last_index + 1),  # Позиция текста
-                line.get_label(),  # Текст метки
+                0.25, ys[k],  # Позиция текста
+                self.LC_names[k],  # Текст метки
                 color='black',  # Цвет текста
                 fontsize=10,  # Размер шрифта
                 transform=ax_legend.transAxes  # Используем относительные координаты
             )
             text.set_picker(True)  # Делаем текст кликабельным
-            legend_items.append((line_patch, text))  # Добавляем элементы легенды в список
+            legend_texts.append(text)  # Добавляем текст легенды в список
 
-        # Подсказка
-        tooltip = None  # Переменная для хранения подсказки
+        def update_legend_rows():
+            """
+            Обновляет тексты и цвета строк легенды для текущего окна расчетных случаев
+            """
+            for k, text in enumerate(legend_texts):
+                i = offset + k  # Расчетный случай, отображаемый в строке k
+                alpha = 0.2 if not visibility[i] else 1.0  # Прозрачность скрытых кривых
+                text.set_text(self.LC_names[i])
+                text.set_alpha(alpha)  # Полупрозрачность текста
+                swatch_colors[k] = line_colors[i]
+                swatch_colors[k, 3] = alpha  # Полупрозрачность цветной линии
+            legend_swatches.set_color(swatch_colors)
 
-        def on_motion(event):
-            nonlocal tooltip  # Используем переменную tooltip из внешней области видимости
-            if event.inaxes == ax_legend:  # Если курсор над областью легенды
-                if tooltip is None or not tooltip.get_visible():  # Если подсказка еще не отображается
-                    # Создаем подсказку
-                    tooltip = ax_legend.annotate(
-                        "Управление видимостью по клику",  # Текст подсказки
-                        xy=(0.5, 1.05),  # Позиция подсказки (в координатах аксиальной системы)
-                        xycoords='axes fraction',  # Используем относительные координаты
-                        ha='center',  # Горизонтальное выравнивание
-                        va='bottom',  # Вертикальное выравнивание
-                        fontsize=10,  # Размер шрифта
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='white', edgecolor='gray', alpha=0.8)  # Стиль фона
-                    )
-                    tooltip.set_visible(True)  # Делаем подсказку видимой
-                    plt.draw()  # Перерисовываем график
+        if n_rows < last_index:
+            # Вертикальный ползунок прокрутки справа от легенды (верхнее положение - начало списка)
+            ax_scroll = fig.add_axes([0.96, 0.4, 0.01, 0.5])  # [left, bottom, width, height]
+            max_offset = last_index - n_rows  # Максимальный индекс первой строки окна
+            scroll = Slider(ax_scroll, '', 0, max_offset, valinit=max_offset, valstep=1, orientation='vertical')
+            scroll.valtext.set_visible(False)  # Числовое значение ползунка не показываем
+            scroll.drawon = False  # Без полной перерисовки фигуры при каждом шаге - обновляем через blitting
+
+            def on_scroll(val):
+                nonlocal offset, background
+                offset = int(max_offset - val)
+                update_legend_rows()
+                if background is None or not fig.canvas.supports_blit:
+                    fig.canvas.draw_idle()  # Бэкенд без поддержки blitting
+                    return
+                fig.canvas.restore_region(background)
+                fig.draw_artist(ax_scroll)  # Ползунок в новом положении
+                background = fig.canvas.copy_from_bbox(fig.bbox)  # Ползунок - часть статичного фона
+                draw_curves()
+                draw_tooltip()
+                # Изменились только строки легенды и ползунок - передаем на экран только их
+                fig.canvas.blit(ax_legend.bbox)
+                fig.canvas.blit(ax_scroll.bbox)
+
+            scroll.on_changed(on_scroll)
+            self._scroll = scroll  # Сохраняем ползунок, чтобы удалить его при повторном построении
+
+        # Кривые, вертикальные линии и элементы легенды перерисовываются поверх кэшированного фона (blitting)
+        dynamic_artists = [curves] + vertical_lines + [legend_swatches] + legend_texts
+        for artist in dynamic_artists:
+            artist.set_animated(True)  # Исключаем из полной перерисовки фигуры
+
+        # Подсказка создается один раз и только показывается/скрывается при наведении
+        tooltip = ax_legend.annotate(
+            "Управление видимостью по клику",  # Текст подсказки
+            xy=(0.5, 1.05),  # Позиция подсказки (в координатах аксиальной системы)
+            xycoords='axes fraction',  # Используем относительные координаты
+            ha='center',  # Горизонтальное выравнивание
+            va='bottom',  # Вертикальное выравнивание
+            fontsize=10,  # Размер шрифта
+            bbox=dict(boxstyle="round,pad=0.3", facecolor='white', edgecolor='gray', alpha=0.8),  # Стиль фона
+            visible=False,  # Изначально подсказка скрыта
+            animated=True  # Подсказка рисуется только через blitting
+        )
+
+        background = None  # Фон фигуры без кривых, легенды и подсказки
+        curves_background = None  # Фон фигуры с кривыми и легендой, но без подсказки
+
+        def draw_curves():
+            nonlocal curves_background
+            for artist in dynamic_artists:
+                fig.draw_artist(artist)  # Невидимые элементы пропускаются самим matplotlib
+            curves_background = fig.canvas.copy_from_bbox(fig.bbox)
+
+        def draw_tooltip():
+            fig.draw_artist(tooltip)  # Скрытая подсказка пропускается самим matplotlib
+
+        def on_draw(event):
+            nonlocal background, curves_background
+            if event.canvas.is_saving():
+                return  # При сохранении в файл matplotlib сам рисует анимированные элементы
+            # После полной перерисовки (в т.ч. при изменении размера окна) обновляем кэш фона,
+            # если холст поддерживает blitting; анимированные элементы дорисовываем в любом случае
+            supports_blit = event.canvas.supports_blit
+            if supports_blit:
+                background = event.canvas.copy_from_bbox(fig.bbox)
+            for artist in dynamic_artists:
+                artist.draw(event.renderer)  # Невидимые элементы пропускаются самим matplotlib
+            if supports_blit:
+                curves_background = event.canvas.copy_from_bbox(fig.bbox)
+            tooltip.draw(event.renderer)
+
+        def blit(redraw_curves):
+            """
+            Обновляет изображение без полной перерисовки фигуры
+            :param redraw_curves: True - перерисовать кривые и легенду, False - только подсказку
+            """
+            if background is None or not fig.canvas.supports_blit:
+                fig.canvas.draw_idle()  # Бэкенд без поддержки blitting
+                return
+            if redraw_curves:
+                fig.canvas.restore_region(background)
+                draw_curves()
+                draw_tooltip()
+                # Изменились только область графика и легенда - передаем на экран только их
+                fig.canvas.blit(ax.bbox)
+                fig.canvas.blit(ax_legend.bbox)
             else:
-                if tooltip is not None and tooltip.get_visible():  # Если подсказка отображается
-                    # Убираем подсказку
-                    tooltip.set_visible(False)  # Делаем подсказку невидимой
-                    plt.draw()  # Перерисовываем график
+                fig.canvas.restore_region(curves_background)
+                draw_tooltip()
+                fig.canvas.blit(fig.bbox)  # Подсказка расположена над областью легенды, вне ее границ
+
+        # Подключаем обработчик полной перерисовки
+        self._cids.append(fig.canvas.mpl_connect('draw_event', on_draw))
+
+        def on_motion(event):
+            show = event.inaxes == ax_legend  # Подсказка видна, пока курсор над областью легенды
+            if show != tooltip.get_visible():  # Перерисовываем только при смене состояния
+                tooltip.set_visible(show)
+                blit(redraw_curves=False)  # Перерисовываем только подсказку
 
         # Подключаем обработчик движения курсора
-        fig.canvas.mpl_connect('motion_notify_event', on_motion)
+        self._cids.append(fig.canvas.mpl_connect('motion_notify_event', on_motion))
 
         # Обработчик кликов по легенде
         def on_legend_click(event):
-            for i, (line_patch, text) in enumerate(legend_items):  # Проходим по всем элементам легенды
+            for k, text in enumerate(legend_texts):  # Проходим по всем элементам легенды
                 if event.artist == text:  # Если кликнули на текст
+                    i = offset + k  # Расчетный случай, отображаемый в этой строке
                     visibility[i] = not visibility[i]  # Переключаем состояние видимости
-                    lines[i].set_visible(visibility[i])  # Обновляем видимость линии
-                    for v_line in vertical_lines[i]:
-                        v_line.set_visible(visibility[i])  # Обновляем видимость вертикальных линий
-                    alpha = 0.2 if not visibility[i] else 1.0  # Устанавливаем прозрачность
-                    line_patch.set_alpha(alpha)  # Полупрозрачность цветной линии
-                    text.set_alpha(alpha)  # Полупрозрачность текста
-                    plt.draw()  # Перерисовываем график
+                    curve_colors[i, 3] = 1.0 if visibility[i] else 0.0  # Обновляем видимость линии в коллекции
+                    curves.set_color(curve_colors)
+                    vertical_lines[i].set_visible(visibility[i])  # Обновляем видимость вертикальных линий
+                    update_legend_rows()  # Полупрозрачность цветной линии и текста
+                    blit(redraw_curves=True)  # Перерисовываем кривые и легенду поверх фона
                     break
 
         # Подключаем обработчик кликов
-        fig.canvas.mpl_connect('pick_event', on_legend_click)
+        self._cids.append(fig.canvas.mpl_connect('pick_event', on_legend_click))
 
         # Область для текста с минимальным КЗ
-        ax_text = fig.add_axes([0.75, 0.1, 0.2, 0.2])  # [left, bottom, width, height]
         ax_text.axis('off')  # Отключаем оси
 
         # Добавляем информацию о минимальном КЗ
-        min_results = self.find_min_ms(sigma_cr / stresses)  # Вычисляем минимальный коэффициент запаса
+        if ms is None:
+            ms = self.calculate_ms(sigma_cr)  # Коэффициенты запаса не переданы - рассчитываем один раз
+        min_results = self.find_min_ms(ms)  # Находим минимальный коэффициент запаса
         min_value = min_results[0][0]  # Минимальное значение КЗ
         result_text = f"Минимальный КЗ:\n{min_value:.2f}\n\n"  # Формируем текст с минимальным КЗ
         result_text += "Случаи его появления:\n"
@@ -209,34 +353,19 @@ class Beam:
             bbox=dict(facecolor='white', alpha=0.8, edgecolor='black')  # Фон текста
         )
 
+        fig.canvas.draw_idle()  # Запрашиваем перерисовку (нужно при повторном построении в уже открытом окне)
         plt.show()  # Отображаем график
   
 # Чтение данных из Excel-файла
-df = pd.read_excel('InputData.xlsx', sheet_name="Лист1", header=None)
-
-# Извлечение необходимых данных
-section_names = df.iloc[0, 2:].dropna().tolist()  # Названия сечений
-X = df.iloc[1, 2:8].values.astype(float)  # Координаты X
-A = df.iloc[3, 2:8].values.astype(float)  # Площади сечений
-
-# Извлечение нагрузок
-column_a = df[0]
-filtered_indices = column_a[column_a.str.contains('Расчетный случай', na=False)].index
-if not filtered_indices.empty:
-    last_index = filtered_indices[-1]
-else:
-    last_index = None
-
-loads = df.iloc[4:(last_index + 1), 2:8].values.astype(float)  # Нагрузки
-LC_names = [f'LC{i + 1}' for i in range(last_index)]  # Названия расчетных случаев
+section_names, X, _, A, loads, LC_names = load_input('InputData.xlsx')  # Модуль Юнга в этом расчете не используется
 
 # Создание объекта балки
 beam = Beam(section_names, X, A, loads, LC_names)
 
-# Расчет напряжений и коэффициентов запаса
+# Расчет коэффициентов запаса (напрямую по нагрузкам)
 sigma_cr = 500  # Критическое напряжение (МПа)
-stresses = beam.calculate_stresses()
-ms = beam.calculate_ms(sigma_cr, stresses)
+ms = beam.calculate_ms(sigma_cr)
 
-# Визуализация результатов
-beam.plot_stresses(stresses, sigma_cr)
\ No newline at end of file
+# Визуализация результатов (напряжения нужны только для построения эпюр)
+stresses = beam.calculate_stresses()
+beam.plot_stresses(stresses, sigma_cr, ms)
\ No newline at end of file
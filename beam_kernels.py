@@ -0,0 +1,67 @@
+import numpy as np
+
+try:
+    import numba  # JIT-компиляция численных ядер (необязательная зависимость)
+except ImportError:
+    numba = None
+
+
+def _compute_ms_and_min_numpy(loads: np.ndarray, EA: np.ndarray, sigma_cr: float):
+    """
+    Запасной вариант на NumPy, если numba не установлена.
+    :param loads: 2D-массив нагрузок [расчетные случаи, сечения]
+    :param EA: 1D-массив жесткостей сечений E * A
+    :param sigma_cr: критическое напряжение
+    :return: 2D-массив запасов прочности, минимальный запас, индекс расчетного случая, индекс сечения
+    """
+    MS = loads / EA / sigma_cr
+    LC_index, CS_index = np.unravel_index(np.argmin(MS), MS.shape)
+    return MS, MS[LC_index, CS_index], LC_index, CS_index
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _compute_ms_and_min_numba(loads, EA, sigma_cr):
+        n_lc, n_cs = loads.shape
+        MS = np.empty((n_lc, n_cs), dtype=loads.dtype)
+        row_min = np.empty(n_lc, dtype=loads.dtype)  # Минимум в каждой строке (расчетном случае)
+        row_arg = np.empty(n_lc, dtype=np.int64)  # Индекс сечения с минимумом в строке
+
+        # Параллельный проход по расчетным случаям: запас прочности и минимум строки за один проход.
+        # Как и np.argmin, первое значение NaN считается минимумом (NaN != NaN)
+        for i in numba.prange(n_lc):
+            arg = 0
+            for j in range(n_cs):
+                MS[i, j] = loads[i, j] / EA[j] / sigma_cr
+                current = MS[i, arg]  # Сравниваем уже округленные до типа MS значения
+                if current == current and (MS[i, j] != MS[i, j] or MS[i, j] < current):
+                    arg = j
+            row_min[i] = MS[i, arg]
+            row_arg[i] = arg
+
+        # Последовательное объединение минимумов строк (первое вхождение и первый NaN, как у np.argmin)
+        LC_index = 0
+        for i in range(1, n_lc):
+            best = row_min[LC_index]
+            if best != best:
+                break  # NaN в более ранней строке - это первый NaN всего массива
+            if row_min[i] != row_min[i] or row_min[i] < best:
+                LC_index = i
+        return MS, row_min[LC_index], LC_index, row_arg[LC_index]
+
+
+def compute_ms_and_min(loads: np.ndarray, EA: np.ndarray, sigma_cr: float):
+    """
+    Рассчитывает запасы прочности для всех расчетных случаев и находит минимальный за один проход.
+    При наличии numba используется скомпилированное параллельное ядро, иначе - NumPy.
+    :param loads: 2D-массив нагрузок [расчетные случаи, сечения]
+    :param EA: 1D-массив жесткостей сечений E * A
+    :param sigma_cr: критическое напряжение
+    :return: 2D-массив запасов прочности, минимальный запас, индекс расчетного случая, индекс сечения
+    """
+    if loads.size == 0:
+        # Для пустого массива минимума нет: numba-ядро вернуло бы мусор, поэтому проверяем заранее
+        raise ValueError("attempt to get argmin of an empty sequence")
+    if numba is None:
+        return _compute_ms_and_min_numpy(loads, EA, sigma_cr)
+    return _compute_ms_and_min_numba(loads, EA, loads.dtype.type(sigma_cr))  # sigma_cr в типе нагрузок, как при трансляции в NumPy
@@ -1,6 +1,11 @@
 import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection  # Набор кривых одним объектом
+from matplotlib.lines import Line2D  # Элементы легенды для коллекции кривых
 from section import Section
+from beam_kernels import compute_ms_and_min  # Совмещенный расчет КЗ и их минимума
+from plot_utils import build_curve_segments  # Вершины кривых для LineCollection
 from typing import List # Для аннотации типов данных 
 
 class Beam:
@@ -17,18 +22,19 @@ class Beam:
         LC: List[str]  # Список названий расчетных случаев
         """
         self.section = section  # Сохраняем объект Section
+        self._sigma_buf = np.empty_like(section.loads)  # Буфер для результата calculate_sigma (без новых выделений памяти)
+        self._fig = None  # Окно графика, переиспользуемое при повторных вызовах plot_sigma
+        self._cids = []  # Идентификаторы обработчиков событий текущего окна
 
     def calculate_sigma (self):
         """
         Рассчитывает напряжения для всех расчетных случаев.
+        Результат записывается в общий буфер объекта, поэтому повторный вызов перезаписывает предыдущий результат.
         :return: 2D-массив массив напряжений [расчетные случаи, сечения]
         """
-        # Преобразуем данные в NumPy массивы
-        loads = np.array(self.section.loads)  # 2D-массив нагрузок        
-        E = np.array(self.section.E)         # 1D-массив модулей Юнга
-        A = np.array(self.section.A)         # 1D-массив площадей поперечных сечений
-
-        return loads / (E * A)
+        # Данные уже приведены к NumPy массивам в Section, произведение E * A рассчитано заранее
+        np.divide(self.section.loads, self.section.EA, out=self._sigma_buf)
+        return self._sigma_buf
     
     def calculate_MS(self, sigma: np.ndarray, sigma_cr: int):
         """
@@ -39,22 +45,28 @@ class Beam:
         """
         return sigma / sigma_cr
     
+    def calculate_MS_and_min(self, sigma_cr: float):
+        """
+        Рассчитывает запас прочности для всех расчетных случаев и сразу находит минимальный
+        (один проход вместо calculate_sigma + calculate_MS + find_min_MS).
+        :param sigma_cr: критическое напряжение
+        :return: 2D-массив запасов прочности и кортеж (минимальный запас прочности, координата сечения, название расчетного случая)
+        """
+        MS, MSmin, LC_index, CS_index = compute_ms_and_min(self.section.loads, self.section.EA, sigma_cr)
+        return MS, (MSmin, self.section.X[CS_index], self.section.LC[LC_index])
+
     def find_min_MS(self, MS: np.ndarray):
         """
         Находит минимальный запас прочности и соответствующие ему координату сечения и расчетный случай.
         :param MS: 2D-массив запасов прочности [расчетные случаи, сечения]
         :return: минимальный запас прочности, координата сечения, название расчетного случая
         """
-        # Преобразуем MS в numpy массив 
-        MS = np.array(MS)
-
-        # Находим минимальное значение и его индекс
-        MSmin = np.min(MS)
-        MSmin_index = np.argmin(MS)
+        # Преобразуем MS в numpy массив (без копирования, если это уже массив)
+        MS = np.asarray(MS)
 
-        # Вычисляем индексы расчетного случая (LC) и сечения (X)
-        LC_index = MSmin_index // MS.shape[1]  # Индекс строки (расчетный случай)
-        CS_index = MSmin_index % MS.shape[1]   # Индекс столбца (сечение)
+        # Находим индексы расчетного случая (LC) и сечения (X) минимального значения за один проход
+        LC_index, CS_index = np.unravel_index(np.argmin(MS), MS.shape)
+        MSmin = MS[LC_index, CS_index]
 
         # Получаем координату сечения и название расчетного случая
         section_X = self.section.X[CS_index]
@@ -63,34 +75,76 @@ class Beam:
         # Возвращаем результат
         return MSmin, section_X, LC_name
 
-    def plot_sigma(self, stresses: np.ndarray, sigma_cr: float, MS: np.ndarray):
+    def plot_sigma(self, stresses: np.ndarray, sigma_cr: float, MS: np.ndarray, MS_min: tuple = None):
         """
         Строит эпюры напряжений для всех расчетных случаев и добавляет информацию о минимальном запасе прочности.
         :param stresses: 2D-массив напряжений [расчетные случаи, сечения]
         :param sigma_cr: критическое напряжение
         :param MS: 2D-массив запасов прочности [расчетные случаи, сечения]
+        :param MS_min: уже найденный минимум (результат calculate_MS_and_min), чтобы не искать его повторно
         """
         # Находим минимальный запас прочности и связанные данные
-        MSmin, section_X, LC_name = self.find_min_MS(MS)
-
-        # Создаем график
-        fig, ax = plt.subplots(figsize=(12, 6))
-        fig.canvas.manager.set_window_title("Эпюры напряжений")
-
-        # Создаем список линий и их меток
-        lines = []
-        for i in range(stresses.shape[0]):
-            line, = ax.plot(self.section.X, stresses[i], label=self.section.LC[i])
-            lines.append(line)
+        if MS_min is None:
+            MS_min = self.find_min_MS(MS)
+        MSmin, section_X, LC_name = MS_min
+
+        # Создаем график или очищаем уже открытое окно без создания новой фигуры
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, self._ax = plt.subplots(figsize=(12, 6))
+            self._fig.canvas.manager.set_window_title("Эпюры напряжений")
+        else:
+            for cid in self._cids:
+                self._fig.canvas.mpl_disconnect(cid)  # Отключаем обработчики предыдущего построения
+            for text in self._fig.texts[:]:
+                text.remove()  # Удаляем аннотацию предыдущего построения
+            self._ax.cla()
+        self._cids = []
+        fig, ax = self._fig, self._ax
+
+        # Все кривые рисуются одной коллекцией отрезков вместо отдельной линии на каждый расчетный случай
+        n_lc = stresses.shape[0]
+        segments = build_curve_segments(self.section.X, stresses)  # Один массив вершин [расчетные случаи, сечения, (x, y)]
+        colors = plt.cm.tab10(np.arange(n_lc) % 10)  # RGBA-цвета кривых (альфа-канал управляет видимостью)
+        # Упрощение путей кривых: Path читает эти настройки при создании, поэтому они действуют
+        # только на эту коллекцию и не меняют глобальные rcParams
+        with mpl.rc_context({'path.simplify': True, 'path.simplify_threshold': 1.0}):
+            curves = LineCollection(segments, colors=colors, rasterized=True)  # Растровая отрисовка при сохранении в векторные форматы
+        ax.add_collection(curves)
+        ax.autoscale_view()  # Коллекция не пересчитывает масштаб осей автоматически
+        visibility = [True] * n_lc  # Все кривые изначально видимы
 
         # Добавляем горизонтальную линию для критического напряжения
-        ax.axhline(y=sigma_cr, color='r', linestyle='--', label=f'Критическое напряжение ({sigma_cr} МПа)')
+        cr_line = ax.axhline(y=sigma_cr, color='r', linestyle='--', label=f'Критическое напряжение ({sigma_cr} МПа)')
+
+        # Элементы легенды для кривых коллекции
+        handles = [Line2D([], [], color=tuple(colors[i]), label=self.section.LC[i]) for i in range(n_lc)]
 
         # Настройка графика
         ax.set_xlabel('Координата X')
         ax.set_ylabel('Напряжение, МПа')
         ax.set_title('Эпюры напряжений для всех расчетных случаев')
-        legend = ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')  # Легенда справа от графика
+        legend = ax.legend(handles=handles + [cr_line], bbox_to_anchor=(1.05, 1), loc='upper left')  # Легенда справа от графика (фиксированное положение, без поиска 'best')
+
+        # Кривые и легенда перерисовываются поверх кэшированного фона (blitting)
+        dynamic_artists = [curves, legend]
+        for artist in dynamic_artists:
+            artist.set_animated(True)  # Исключаем из полной перерисовки фигуры
+
+        background = None  # Фон фигуры без кривых и легенды
+
+        def on_draw(event):
+            nonlocal background
+            if event.canvas.is_saving():
+                return  # При сохранении в файл matplotlib сам рисует анимированные элементы
+            # После полной перерисовки (в т.ч. при изменении размера окна) обновляем кэш фона,
+            # если холст поддерживает blitting; кривые и легенду дорисовываем в любом случае
+            if event.canvas.supports_blit:
+                background = event.canvas.copy_from_bbox(fig.bbox)
+            for artist in dynamic_artists:
+                artist.draw(event.renderer)
+
+        # Подключаем обработчик полной перерисовки
+        self._cids.append(fig.canvas.mpl_connect('draw_event', on_draw))
 
         # Добавляем текстовую аннотацию с минимальным запасом прочности
         annotation_text = (
@@ -111,36 +165,43 @@ class Beam:
             # Проверяем, что клик был внутри области легенды
             if legend.get_window_extent().contains(event.x, event.y):
                 # Определяем, на какой текст легенды кликнули
-                for text, handle in zip(legend.get_texts(), legend.legend_handles):
+                for i, text in enumerate(legend.get_texts()):
                     if text.get_window_extent().contains(event.x, event.y):
-                        label = text.get_text()  # Получаем метку LCi
                         break
                 else:
                     return  # Если клик не попал на текст, выходим
-
-                # Находим соответствующую линию
-                for line, handle, text in zip(lines, legend.legend_handles, legend.get_texts()):
-                    if line.get_label() == label:
-                        # Переключаем видимость линии
-                        visible = not line.get_visible()
-                        line.set_visible(visible)
-                        
-                        # Изменяем цвет текста легенды
-                        text.set_color('gray' if not visible else 'black')
-                        
-                        # Изменяем цвет маркера в легенде
-                        handle.set_color('gray' if not visible else line.get_color())
-                        handle.set_alpha(0.2 if not visible else 1.0)
-                        break
-
-                # Обновляем график
-                fig.canvas.draw()
+                if i >= n_lc:
+                    return  # Линия критического напряжения не скрывается
+
+                # Переключаем видимость кривой через альфа-канал ее цвета в коллекции
+                visibility[i] = not visibility[i]
+                visible = visibility[i]
+                colors[i, 3] = 1.0 if visible else 0.0
+                curves.set_color(colors)
+
+                # Изменяем цвет текста легенды
+                text.set_color('gray' if not visible else 'black')
+
+                # Изменяем цвет маркера в легенде
+                handle = legend.legend_handles[i]
+                handle.set_color('gray' if not visible else tuple(colors[i, :3]))
+                handle.set_alpha(0.2 if not visible else 1.0)
+
+                # Обновляем график: восстанавливаем фон и перерисовываем только кривые и легенду
+                if background is None or not fig.canvas.supports_blit:
+                    fig.canvas.draw_idle()  # Бэкенд без поддержки blitting
+                    return
+                fig.canvas.restore_region(background)
+                for artist in dynamic_artists:
+                    fig.draw_artist(artist)
+                fig.canvas.blit(fig.bbox)
 
         # Подключаем обработчик событий
-        fig.canvas.mpl_connect('button_press_event', on_legend_click)
+        self._cids.append(fig.canvas.mpl_connect('button_press_event', on_legend_click))
 
         # Настройка макета
-        plt.grid(True)
-        plt.tight_layout()
+        ax.grid(True)
+        fig.tight_layout()
+        fig.canvas.draw_idle()  # Запрашиваем перерисовку (нужно при повторном построении в уже открытом окне)
         plt.show()
     
\ No newline at end of file
@@ -0,0 +1,59 @@
+import openpyxl  # Для работы с Excel-файлами
+import numpy as np  # Для числовых расчетов и работы с массивами
+from typing import List  # Для аннотации типов данных
+
+try:
+    from python_calamine import CalamineWorkbook  # Быстрое чтение Excel-файлов на Rust (необязательная зависимость)
+except ImportError:
+    CalamineWorkbook = None
+
+
+def _read_rows(path: str, sheet_name: str) -> List[list]:
+    """
+    Читает все строки листа Excel-файла, начиная с ячейки A1.
+    :param path: путь к Excel-файлу
+    :param sheet_name: название листа
+    :return: список строк, пустые ячейки - None
+    """
+    if CalamineWorkbook is not None:
+        with CalamineWorkbook.from_path(path) as wb:  # Файл закрывается после чтения листа
+            values = wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        # calamine возвращает пустые ячейки как пустые строки
+        return [[None if value == "" else value for value in row] for row in values]
+
+    # Потоковое чтение без построения DataFrame
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    rows = [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+    wb.close()
+    return rows
+
+
+def load_input(path: str, sheet_name: str = "Лист1"):
+    """
+    Загружает исходные данные для расчета балки из Excel-файла.
+    :param path: путь к Excel-файлу
+    :param sheet_name: название листа с данными
+    :return: названия сечений, координаты X, модули Юнга, площади сечений, 2D-массив нагрузок, названия расчетных случаев
+    """
+    rows = _read_rows(path, sheet_name)
+
+    # Данные хранятся в float32: напряжения (МПа) и КЗ с запасом укладываются в его точность,
+    # а объем памяти и трафик для больших наборов расчетных случаев сокращаются вдвое.
+    # Скалярное sigma_cr при расчетах приводится к float32 при трансляции (broadcasting)
+
+    # Извлечение необходимых данных
+    CS = [name for name in rows[0][2:8] if name is not None]  # Названия сечений
+    X = np.array(rows[1][2:8], dtype=np.float32)  # Координаты X
+    E = np.array(rows[2][2:8], dtype=np.float32)  # Модуль Юнга
+    A = np.array(rows[3][2:8], dtype=np.float32)  # Площади сечений
+
+    # Извлечение нагрузок
+    last_index = None  # Индекс строки последнего расчетного случая
+    for i, row in enumerate(rows):
+        if isinstance(row[0], str) and 'Расчетный случай' in row[0]:
+            last_index = i
+
+    loads = np.array([row[2:8] for row in rows[4:(last_index + 1)]], dtype=np.float32)  # Нагрузки
+    LC = [f'LC{i + 1}' for i in range(last_index)]  # Названия расчетных случаев
+
+    return CS, X, E, A, loads, LC
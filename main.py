@@ -1,31 +1,15 @@
-import pandas as pd  # Для работы с Excel-файлами
 import numpy as np  # Для числовых расчетов и работы с массивами
 import matplotlib.pyplot as plt  # Графики
 from beam_utils import Beam
 from section import Section
+from io_utils import load_input
 
 def main():
     """
     Основная функция для выполнения расчетов и визуализации.
     """
     # Чтение данных из Excel-файла
-    df = pd.read_excel('InputData.xlsx', sheet_name="Лист1", header=None)
-
-    # Извлечение необходимых данных
-    CS = df.iloc[0, 2:8].dropna().tolist()  # Названия сечений
-    X = df.iloc[1, 2:8].values.astype(float)  # Координаты X
-    E = df.iloc[2, 2:8].values.astype(float)  # Модуль Юнга
-    A = df.iloc[3, 2:8].values.astype(float)  # Площади сечений
-    # Извлечение нагрузок
-    column_a = df[0]
-    filtered_indices = column_a[column_a.str.contains('Расчетный случай', na=False)].index
-    if not filtered_indices.empty:
-        last_index = filtered_indices[-1]
-    else:
-        last_index = None
-
-    loads = df.iloc[4:(last_index + 1), 2:8].values.astype(float)  # Нагрузки
-    LC = [f'LC{i + 1}' for i in range(last_index)]  # Названия расчетных случаев
+    CS, X, E, A, loads, LC = load_input('InputData.xlsx')
 
     #создание объекта сечений, описыващих балку
     section_data = Section(CS, X, E, A, loads, LC)
@@ -36,9 +20,9 @@ def main():
     # Расчет напряжений, коэффициентов запаса и минимального КЗ
     sigma_cr = 1.5  # Критическое напряжение (МПа)
     sigma = beam.calculate_sigma() # Расчет напряжений в каждом сечении для каждого расчетного случая
-    MS = beam.calculate_MS(sigma, sigma_cr) # Расчет коэффициентов запаса
+    MS, MS_min = beam.calculate_MS_and_min(sigma_cr) # Расчет коэффициентов запаса и минимального КЗ
     # Визуализация результатов
-    beam.plot_sigma(sigma, sigma_cr, MS)
+    beam.plot_sigma(sigma, sigma_cr, MS, MS_min)
 
 # Проверка, что файл запущен напрямую (а не импортирован)
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+import numpy as np  # Для работы с массивами вершин
+
+
+def build_curve_segments(X: np.ndarray, values: np.ndarray, where: str = None) -> np.ndarray:
+    """
+    Строит массив вершин кривых всех расчетных случаев для одной LineCollection.
+    :param X: 1D-массив координат X сечений
+    :param values: 2D-массив значений [расчетные случаи, сечения]
+    :param where: None - ломаная через точки, 'post' - ступеньки (как ax.step(..., where='post'))
+    :return: 3D-массив вершин [расчетные случаи, точки, (x, y)]
+    """
+    if where not in (None, 'post'):
+        raise ValueError(f"where должен быть None или 'post', получено: {where!r}")
+    X = np.asarray(X)
+    values = np.asarray(values)
+    if where == 'post':
+        # Ступенька: значение сохраняется до следующей координаты X (2 * n - 1 вершин на кривую)
+        n_cs = X.shape[0]
+        segments = np.empty((values.shape[0], 2 * n_cs - 1, 2), dtype=np.result_type(X, values))
+        segments[:, 0::2, 0] = X
+        segments[:, 1::2, 0] = X[1:]
+        segments[:, 0::2, 1] = values
+        segments[:, 1::2, 1] = values[:, :-1]
+        return segments
+    return np.stack([np.broadcast_to(X, values.shape), values], axis=-1)
@@ -22,8 +22,16 @@ class Section:
         :param LC: список названий расчетных случаев
         """
         self.CS = CS  # Сохраняем названия сечений
-        self.X = X  # Сохраняем координаты X сечений
-        self.E = E  # Сохраняем массив значений модуля Юнга в сечении
-        self.A = A  # Сохраняем площади сечений
-        self.loads = loads  # Сохраняем нагрузки (форма: [нагрузки, расчетные_случаи, сечения])
+        # Приводим данные к вещественным массивам один раз, чтобы расчеты не копировали их повторно.
+        # Точность входных данных сохраняется (float32 из io_utils остается float32, float64 - float64),
+        # целые значения приводятся к вещественному типу по правилам NumPy.
+        # X, E и A хранятся в одном массиве [сечения, (X, E, A)]: значения каждого сечения лежат в памяти рядом
+        XEA = np.column_stack([X, E, A])
+        self._XEA = np.ascontiguousarray(XEA, dtype=np.result_type(XEA, np.float32))
+        self.X = self._XEA[:, 0]  # Сохраняем координаты X сечений (представление без копирования)
+        self.E = self._XEA[:, 1]  # Сохраняем массив значений модуля Юнга в сечении (представление без копирования)
+        self.A = self._XEA[:, 2]  # Сохраняем площади сечений (представление без копирования)
+        loads = np.asarray(loads)
+        self.loads = np.ascontiguousarray(loads, dtype=np.result_type(loads, np.float32))  # Сохраняем нагрузки (форма: [нагрузки, расчетные_случаи, сечения])
+        self.EA = self._XEA[:, 1] * self._XEA[:, 2]  # Жесткость сечений на растяжение-сжатие (общая для всех расчетных случаев)
         self.LC = LC  # Сохраняем названия расчетных случаев
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import beam_kernels
+
+numba = pytest.importorskip('numba')
+
+NAN = np.nan
+
+CASES = {
+    # Одинаковые минимумы: должен выбираться первый по порядку элементов
+    'ties': [[3.0, 1.0, 2.0],
+             [1.0, 5.0, 1.0]],
+    # NaN в середине массива
+    'nan': [[4.0, 3.0, 2.0],
+            [5.0, 1.0, 6.0],
+            [NAN, 7.0, NAN]],
+    # NaN в первом столбце строки и повторный NaN в более поздней строке
+    'nan_first_column': [[NAN, 2.0, 3.0],
+                         [1.0, NAN, 0.5]],
+    # NaN и одинаковые минимумы одновременно
+    'nan_with_ties': [[2.0, 1.0, 1.0],
+                      [1.0, 3.0, NAN],
+                      [NAN, 1.0, 1.0]],
+}
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+@pytest.mark.parametrize('case', CASES)
+def test_numba_kernel_matches_numpy(case, dtype):
+    loads = np.array(CASES[case], dtype=dtype)
+    EA = np.full(loads.shape[1], 2.0, dtype=dtype)
+    sigma_cr = 1.5
+
+    MS_nb, min_nb, lc_nb, cs_nb = beam_kernels._compute_ms_and_min_numba(loads, EA, loads.dtype.type(sigma_cr))
+    MS_np, min_np, lc_np, cs_np = beam_kernels._compute_ms_and_min_numpy(loads, EA, sigma_cr)
+
+    np.testing.assert_array_equal(MS_nb, MS_np)
+    np.testing.assert_equal(min_nb, min_np)
+    assert (lc_nb, cs_nb) == (lc_np, cs_np)
+
+
+@pytest.mark.parametrize('use_numba', [True, False])
+@pytest.mark.parametrize('shape', [(0, 3), (2, 0)])
+def test_empty_loads_raise(shape, use_numba, monkeypatch):
+    if not use_numba:
+        monkeypatch.setattr(beam_kernels, 'numba', None)  # Принудительно NumPy
+    loads = np.empty(shape, dtype=np.float32)
+    EA = np.full(shape[1], 2.0, dtype=np.float32)
+
+    with pytest.raises(ValueError):
+        beam_kernels.compute_ms_and_min(loads, EA, 1.5)
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pytest
+
+import io_utils
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_PATH = os.path.join(REPO_ROOT, 'InputData.xlsx')
+
+LOADS_FIRST_ROW = [
+    452586.27356499003, 829267.43182657543, 1041640.1103366669,
+    1146800.245626701, 180587.91019643829, 1009985.3814294505,
+]
+
+
+@pytest.fixture(params=['openpyxl', 'calamine'])
+def backend(request, monkeypatch):
+    if request.param == 'openpyxl':
+        monkeypatch.setattr(io_utils, 'CalamineWorkbook', None)  # Принудительно openpyxl
+    else:
+        calamine = pytest.importorskip('python_calamine')
+        monkeypatch.setattr(io_utils, 'CalamineWorkbook', calamine.CalamineWorkbook)
+    return request.param
+
+
+def test_load_input(backend):
+    CS, X, E, A, loads, LC = io_utils.load_input(INPUT_PATH)
+
+    assert CS == ['A-A', 'B-B', 'C-C', 'D-D', 'E-E', 'F-F']
+    for array in (X, E, A):
+        assert array.shape == (6,)
+        assert array.dtype == np.float32
+    assert loads.shape == (10, 6)
+    assert loads.dtype == np.float32
+    assert len(LC) == 13  # Индекс строки последнего расчетного случая
+    np.testing.assert_array_equal(X, np.arange(6, dtype=np.float32))
+    np.testing.assert_array_equal(loads[0], np.array(LOADS_FIRST_ROW, dtype=np.float32))
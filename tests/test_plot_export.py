@@ -0,0 +1,92 @@
+import importlib
+import io
+import os
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from beam_utils import Beam
+from section import Section
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CURVE_COLOR = np.array(plt.cm.tab10(0)[:3])  # Цвет первой кривой в обоих построителях
+
+
+@pytest.fixture(autouse=True)
+def no_show(monkeypatch):
+    monkeypatch.setattr(plt, 'show', lambda *args, **kwargs: None)
+    yield
+    plt.close('all')
+
+
+@pytest.fixture
+def sigma_figure():
+    section = Section(
+        ['A-A', 'B-B', 'C-C'], [0, 1, 2], [2e5] * 3, [0.01] * 3,
+        np.array([[1e3, 2e3, 3e3], [3e3, 2e3, 1e3]]), ['LC1', 'LC2']
+    )
+    beam = Beam(section)
+    MS, MS_min = beam.calculate_MS_and_min(1.5)
+    beam.plot_sigma(beam.calculate_sigma(), 1.5, MS, MS_min)
+    return beam._fig
+
+
+@pytest.fixture
+def stresses_figure(monkeypatch):
+    # Beam.py - скрипт: при импорте читает InputData.xlsx и строит график
+    monkeypatch.chdir(REPO_ROOT)
+    sys.modules.pop('Beam', None)
+    module = importlib.import_module('Beam')
+    return module.beam._fig
+
+
+def _has_color(image, color, tol=0.02):
+    return np.any(np.all(np.abs(image[..., :3] - color) < tol, axis=-1))
+
+
+@pytest.mark.parametrize('figure_name', ['sigma_figure', 'stresses_figure'])
+def test_screen_draw_shows_curves(figure_name, request):
+    fig = request.getfixturevalue(figure_name)
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba()) / 255
+    assert _has_color(image, CURVE_COLOR)
+
+
+@pytest.mark.parametrize('figure_name', ['sigma_figure', 'stresses_figure'])
+def test_png_export_shows_curves(figure_name, request):
+    fig = request.getfixturevalue(figure_name)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    buf.seek(0)
+    assert _has_color(plt.imread(buf), CURVE_COLOR)
+
+
+# Растровое изображение в векторном файле - признак того, что кривые (rasterized=True) отрисованы
+RASTER_MARKERS = {'pdf': b'/Subtype /Image', 'svg': b'<image'}
+
+
+@pytest.mark.parametrize('figure_name', ['sigma_figure', 'stresses_figure'])
+@pytest.mark.parametrize('fmt', ['pdf', 'svg'])
+def test_vector_export_contains_rasterized_curves(figure_name, fmt, request):
+    fig = request.getfixturevalue(figure_name)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+    assert RASTER_MARKERS[fmt] in buf.getvalue()
+
+
+def test_vector_export_without_rasterized_curves_has_no_image(sigma_figure):
+    # Контрольная проверка: без rasterized=True изображение в PDF не появляется
+    for artist in sigma_figure.axes[0].collections:
+        artist.set_rasterized(False)
+    buf = io.BytesIO()
+    sigma_figure.savefig(buf, format='pdf')
+    assert RASTER_MARKERS['pdf'] not in buf.getvalue()
+
+
+@pytest.mark.parametrize('figure_name', ['sigma_figure', 'stresses_figure'])
+def test_plotting_leaves_global_rcparams_untouched(figure_name, request):
+    before = {key: plt.rcParams[key] for key in ('path.simplify', 'path.simplify_threshold')}
+    request.getfixturevalue(figure_name)
+    assert {key: plt.rcParams[key] for key in before} == before
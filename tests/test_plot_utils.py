@@ -0,0 +1,35 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from plot_utils import build_curve_segments
+
+X = np.array([0.0, 1.0, 2.5, 4.0])
+VALUES = np.array([[1.0, 3.0, 2.0, 5.0], [-1.0, 0.5, 0.5, 2.0]])
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def test_post_segments_match_ax_step(ax):
+    segments = build_curve_segments(X, VALUES, where='post')
+    for curve, y in zip(segments, VALUES):
+        expected = ax.step(X, y, where='post')[0].get_path().vertices
+        np.testing.assert_array_equal(curve, expected)
+
+
+def test_default_segments_match_ax_plot(ax):
+    segments = build_curve_segments(X, VALUES)
+    for curve, y in zip(segments, VALUES):
+        expected = ax.plot(X, y)[0].get_path().vertices
+        np.testing.assert_array_equal(curve, expected)
+
+
+@pytest.mark.parametrize('where', ['pre', 'mid', 'steps-post'])
+def test_unsupported_where_raises(where):
+    with pytest.raises(ValueError):
+        build_curve_segments(X, VALUES, where=where)